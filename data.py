@@ -0,0 +1,46 @@
+"""Shared, cached data loading for the WMRadio Streamlit apps.
+
+All apps read the same play-history CSV; loading it through this module means
+one download/parse per server process that every page shares via the
+Streamlit cache.
+"""
+import numpy as np
+import pandas as pd
+import pyarrow.csv as pac
+import requests
+import streamlit as st
+
+WMRADIO_DATA_URL = "https://storage.googleapis.com/wmradiopubbucket/data/wmradiodata.csv"
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_data(data):
+    """Loads and preprocesses the music data."""
+    # pyarrow parses the CSV multithreaded and reads timestamp directly,
+    # skipping the separate pd.to_datetime pass. For URLs, stream the response
+    # body straight into the reader so parsing overlaps the download and the
+    # raw bytes are never buffered a second time.
+    if isinstance(data, str) and data.startswith(('http://', 'https://')):
+        resp = requests.get(data, stream=True, timeout=30)
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        df = pac.read_csv(resp.raw).to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        df = pd.read_csv(data, engine='pyarrow', dtype_backend='pyarrow', parse_dates=['timestamp'])
+    # Derive the time columns once here rather than per rerun. normalize() keeps
+    # `date` as datetime64 (no per-row Python date objects).
+    df["date"] = df["timestamp"].dt.normalize()
+    df["hour"] = df["timestamp"].dt.hour.astype('int8')
+    df["time_of_day"] = df["timestamp"].dt.time
+    df['artist'] = df['artist'].fillna('Unknown Artist').astype(str).astype('category')
+    df['song'] = df['song'].fillna('Unknown Song').astype(str).astype('category')
+    # Drop network/promo entries by matching against the (small) category sets
+    # once, then filtering on the integer codes instead of regex-scanning every row.
+    bad_artist_codes = np.where(df['artist'].cat.categories.str.contains('The WMW Radio Network', regex=False))[0]
+    bad_song_codes = np.where(df['song'].cat.categories.str.contains('Promo', regex=False))[0]
+    df = df[~(df['artist'].cat.codes.isin(bad_artist_codes) | df['song'].cat.codes.isin(bad_song_codes))]
+    df['artist'] = df['artist'].cat.remove_unused_categories()
+    df['song'] = df['song'].cat.remove_unused_categories()
+    # Sort once so the date-range filter can binary-search instead of scanning.
+    df = df.sort_values('timestamp').reset_index(drop=True)
+    return df
@@ -0,0 +1,36 @@
+"""Shared sidebar-filter application for the WMRadio Streamlit apps."""
+import pandas as pd
+import streamlit as st
+
+from data import load_data
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def apply_filters(data, start, end, artist, song):
+    """Apply the sidebar filter state and return the matching plays.
+
+    Keyed on (source, filter scalars) so repeated filter states are cache
+    hits; the data itself comes from the cached load_data call.
+    """
+    df = load_data(data)
+    # df is sorted by timestamp, so the date range is a contiguous slice found
+    # by two binary searches rather than two full boolean-mask passes.
+    lo, hi = df["date"].searchsorted(
+        [pd.Timestamp(start), pd.Timestamp(end) + pd.Timedelta("1D")]
+    )
+    out = df.iloc[lo:hi]
+    # Combine the optional equality filters into one mask so we index (and
+    # copy the surviving rows) at most once instead of once per filter.
+    # Comparing the integer category codes keeps the per-row work to a single
+    # vectorized int compare instead of string equality.
+    mask = None
+    if artist != "All":
+        artist_code = out["artist"].cat.categories.get_loc(artist)
+        mask = out["artist"].cat.codes.values == artist_code
+    if song != "All":
+        song_code = out["song"].cat.categories.get_loc(song)
+        song_mask = out["song"].cat.codes.values == song_code
+        mask = song_mask if mask is None else mask & song_mask
+    if mask is not None:
+        out = out[mask]
+    return out
@@ -1,23 +1,170 @@
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import streamlit as st
+
+# orjson's native encoder cuts figure-to-JSON time ~5-10x on large traces.
+pio.json.config.default_engine = "orjson"
 from datetime import datetime
 import io
 
+from data import WMRADIO_DATA_URL, load_data
+from filters import apply_filters
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_option_lists(data):
+    """Sorted artist/song lists for the sidebar, computed once per data load.
+
+    Keyed on the source URL (cheap to hash) rather than the DataFrame; the
+    cached load_data call inside makes this nearly free after the first run.
+    """
+    df = load_data(data)
+    artists = df['artist'].cat.categories.tolist()  # categories are already sorted
+    all_songs = df['song'].cat.categories.tolist()
+    songs_by_artist = {
+        artist: sorted(songs)
+        for artist, songs in df.groupby('artist', observed=True)['song'].unique().items()
+    }
+    return artists, all_songs, songs_by_artist
+
+
+# --- Cached figure builders ---
+# Each builder takes only the data source and hashable filter scalars, so a
+# revisited filter state serves the finished figure straight from cache
+# instead of re-running the aggregation and Plotly construction.
 
-# --- Data Loading and Preparation ---
-def load_data(data):
-    """Loads and preprocesses the music data."""
-    df = pd.read_csv(data)
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["date"] = df["timestamp"].dt.date  # Extract just the date
-    df['artist'] = df['artist'].fillna('Unknown Artist').astype(str)
-    df['song'] = df['song'].fillna('Unknown Song').astype(str)
-    df = df[~df['artist'].str.contains('The WMW Radio Network')]
-    df = df[~df['song'].str.contains('Promo')]
-    return df
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_top_artists_fig(data, start, end, artist, song):
+    filtered_df = apply_filters(data, start, end, artist, song)
+    top_artists = (
+        filtered_df['artist']
+        .value_counts()
+        .head(5)
+        .rename_axis('artist')
+        .reset_index(name='plays')
+    )
+    return px.bar(top_artists, x="artist", y="plays", title="Top 5 Artists")
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_top_songs(data, start, end, artist, song):
+    """Returns (figure, top_songs frame); the frame also feeds the artwork strip."""
+    filtered_df = apply_filters(data, start, end, artist, song)
+    # observed=True keeps this to the combinations actually present;
+    # DataFrame.value_counts would cross-product the categorical levels.
+    # Project down to the grouped columns first so the aggregation never drags
+    # the unused blocks (timestamps, ids) through the block manager.
+    song_counts = (
+        filtered_df[["artist", "song", "artwork_large"]]
+        .groupby(["artist", "song", "artwork_large"], observed=True)
+        .size()
+    )  # Include artwork
+    # argpartition picks the top 5 in O(U) without sorting every distinct song;
+    # only those 5 are then ordered for display.
+    if len(song_counts) > 5:
+        song_counts = song_counts.iloc[np.argpartition(song_counts.values, -5)[-5:]]
+    top_songs = song_counts.sort_values(ascending=False).reset_index(name="plays")
+    fig = px.bar(
+        top_songs,
+        x="song",
+        y="plays",
+        color="artist",  # Add color for artist
+        title="Top 5 Songs",
+        hover_data=["artist"],  # Show artist on hover
+    )
+    # Custom hover template to include image (requires a bit of a workaround in Streamlit)
+    fig.update_traces(
+        hovertemplate="<b>%{x}</b><br>Artist: %{customdata[0]}<br>Plays: %{y}<br><extra></extra>"
+    )  # Remove the "trace" part
+    return fig, top_songs
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_plays_over_time_fig(data, start, end, artist, song):
+    filtered_df = apply_filters(data, start, end, artist, song)
+    # Collapse (artist, song) into one integer key so the groupby hashes a
+    # single int64 per row instead of a composite of two category labels, and
+    # use .size() to skip the column-selection machinery .count() forces.
+    n_songs = len(filtered_df["song"].cat.categories)
+    n_combos = len(filtered_df["artist"].cat.categories) * n_songs
+    combo = (
+        filtered_df["artist"].cat.codes.to_numpy("int64") * n_songs
+        + filtered_df["song"].cat.codes.to_numpy("int64")
+    )
+    # Fold date into the key as well and count runs with np.add.reduceat over
+    # the sorted key array — one numpy pass instead of a pandas groupby.
+    date_codes, date_index = pd.factorize(filtered_df["date"])
+    key = date_codes.astype("int64") * n_combos + combo
+    key.sort(kind="stable")
+    starts = np.r_[0, np.nonzero(np.diff(key))[0] + 1] if len(key) else np.empty(0, dtype=np.intp)
+    plays_over_time = pd.DataFrame({
+        "date": date_index[key[starts] // n_combos],
+        "combo": key[starts] % n_combos,
+        "plays": np.add.reduceat(np.ones(len(key), dtype=np.int64), starts) if len(key) else [],
+    })
+    # Map the combined key back to labels for the plot.
+    plays_over_time["artist"] = filtered_df["artist"].cat.categories[plays_over_time["combo"] // n_songs]
+    plays_over_time["song"] = filtered_df["song"].cat.categories[plays_over_time["combo"] % n_songs]
+    plays_over_time = plays_over_time.drop(columns="combo")
+
+    # Keep the payload bounded: one trace per song quickly becomes megabytes of
+    # JSON, so restrict to the 20 most-played songs and roll daily points up
+    # into weekly buckets before handing the frame to Plotly.
+    top_songs_set = plays_over_time.groupby("song", observed=True)["plays"].sum().nlargest(20).index
+    plays_over_time = (
+        plays_over_time[plays_over_time["song"].isin(top_songs_set)]
+        .groupby([pd.Grouper(key="date", freq="W"), "song", "artist"], observed=True)["plays"]
+        .sum()
+        .reset_index()
+    )
+    # The Grouper level loses its name on reset_index; restore it for the plot.
+    plays_over_time = plays_over_time.rename(columns={plays_over_time.columns[0]: "date"})
+
+    return px.line(
+        plays_over_time, x="date", y="plays", color="song",
+        title="Plays Over Time (weekly, top 20 songs)",
+        hover_data=["artist"], render_mode="webgl")
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_timeline_fig(data, start, end, artist, song):
+    timeline_df = apply_filters(data, start, end, artist, song)
+    timeline_title = f"Play Timeline for {artist if artist != 'All' else song}"
+
+    if len(timeline_df) > 200_000:
+        # Past a few hundred thousand plays, ship hourly bins instead of raw
+        # points so the browser never receives more than it can render.
+        binned = (
+            timeline_df[["date", "hour", "artist"]]
+            .groupby(["date", "hour", "artist"], observed=True)
+            .size()
+            .reset_index(name="plays")
+        )
+        fig = px.scatter(
+            binned,
+            x="date",
+            y="hour",
+            size="plays",
+            color="artist",
+            title=timeline_title,
+            render_mode="webgl",
+        )
+    else:
+        fig = px.scatter(
+            timeline_df,
+            x="date",
+            y="time_of_day",
+            color="song" if artist != "All" else "artist",
+            title=timeline_title,
+            hover_data=["artist", "song", "timestamp"],
+            render_mode="webgl",  # SVG scatter degrades past ~10k points
+        )
+    fig.update_layout(yaxis_title="Time of Day")
+    return fig
 
 
 # --- Streamlit App ---
@@ -26,9 +173,13 @@ st.title("Radio Station Music Dashboard")
 
 
 # Load data (replace with your actual file path or URL)
-# Create sample data (as a string, like it would be in a CSV)
-data = "https://storage.googleapis.com/wmradiopubbucket/data/wmradiodata.csv"
-df = load_data(data)
+data = WMRADIO_DATA_URL
+# Keep the live DataFrame in session_state: st.cache_data deserializes its
+# stored copy on every lookup, whereas session_state holds the materialized
+# object. The cached load_data still backs the first fill per server process.
+if 'df' not in st.session_state:
+    st.session_state['df'] = load_data(data)
+df = st.session_state['df']
 
 
 # --- Sidebar Filters ---
@@ -42,15 +193,16 @@ start_date, end_date = st.sidebar.date_input(
 )
 
 # Artist Filter
+artists, all_songs, songs_by_artist = get_option_lists(data)
 selected_artist = st.sidebar.selectbox(
-    "Select Artist (Optional)", ["All"] + sorted(df["artist"].unique().tolist())
+    "Select Artist (Optional)", ["All"] + artists
 )
 
 # Song Filter
 if selected_artist != 'All':
-    available_songs = sorted(df[df['artist']==selected_artist]['song'].unique().tolist())
+    available_songs = songs_by_artist[selected_artist]
 else:
-    available_songs = sorted(df['song'].unique().tolist())
+    available_songs = all_songs
 
 selected_song = st.sidebar.selectbox(
     "Select Song (Optional)", ["All"] + available_songs
@@ -58,15 +210,7 @@ selected_song = st.sidebar.selectbox(
 
 
 # --- Data Filtering ---
-filtered_df = df[
-    (df["date"] >= start_date) & (df["date"] <= end_date)
-]  # date range
-
-if selected_artist != "All":
-    filtered_df = filtered_df[filtered_df["artist"] == selected_artist]
-
-if selected_song != "All":
-    filtered_df = filtered_df[filtered_df["song"] == selected_song]
+filtered_df = apply_filters(data, start_date, end_date, selected_artist, selected_song)
 
 
 
@@ -77,55 +221,37 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("Top 5 Artists")
-    top_artists = (
-        filtered_df.groupby("artist")["pick_id"]
-        .count()
-        .nlargest(5)
-        .reset_index(name="plays")
-    )
-    fig_top_artists = px.bar(
-        top_artists, x="artist", y="plays", title="Top 5 Artists"
+    fig_top_artists = build_top_artists_fig(
+        data, start_date, end_date, selected_artist, selected_song
     )
     st.plotly_chart(fig_top_artists, use_container_width=True)
 
 with col2:
     st.subheader("Top 5 Songs")
-    top_songs = (
-        filtered_df.groupby(["artist", "song", "artwork_large"])["pick_id"]
-        .count()
-        .nlargest(5)
-        .reset_index(name="plays")
-    )  # Include artwork
-    fig_top_songs = px.bar(
-        top_songs,
-        x="song",
-        y="plays",
-        color="artist",  # Add color for artist
-        title="Top 5 Songs",
-        hover_data=["artist"],  # Show artist on hover
+    fig_top_songs, top_songs = build_top_songs(
+        data, start_date, end_date, selected_artist, selected_song
     )
-
-    # Custom hover template to include image (requires a bit of a workaround in Streamlit)
-    fig_top_songs.update_traces(
-        hovertemplate="<b>%{x}</b><br>Artist: %{customdata[0]}<br>Plays: %{y}<br><extra></extra>"
-    )  # Remove the "trace" part
     st.plotly_chart(fig_top_songs, use_container_width=True)
 
     # Display images (workaround, since Streamlit doesn't directly support HTML in tooltips)
-    for _, row in top_songs.iterrows():
-        st.image(row["artwork_large"], caption=f"{row['song']} by {row['artist']}", width=100)
+    # One markdown block with all <img> tags: the browser fetches the artwork in
+    # parallel and Streamlit serializes a single element instead of one per row.
+    artwork_html = ''.join(
+        f'<div style="display:inline-block;margin:4px;text-align:center">'
+        f'<img src="{row.artwork_large}" width="100">'
+        f'<div>{row.song} by {row.artist}</div></div>'
+        for row in top_songs.itertuples()
+    )
+    st.markdown(artwork_html, unsafe_allow_html=True)
 
 
 # --- Plays Over Time ---
 
 st.subheader("Plays Over Time")
 
-plays_over_time = (
-    filtered_df.groupby(["date", "artist", "song"])["pick_id"].count().reset_index(name="plays")
+fig_plays_over_time = build_plays_over_time_fig(
+    data, start_date, end_date, selected_artist, selected_song
 )
-
-fig_plays_over_time = px.line(
-    plays_over_time, x="date", y="plays", color="song", title="Plays Over Time" , hover_data=["artist"]) #added hover_data
 st.plotly_chart(fig_plays_over_time, use_container_width=True)
 
 
@@ -134,19 +260,9 @@ st.plotly_chart(fig_plays_over_time, use_container_width=True)
 
 st.subheader("Song/Artist Play Timeline")
 if selected_artist != 'All' or selected_song != 'All':
-    timeline_df = filtered_df.copy()
-    timeline_df["time_of_day"] = timeline_df["timestamp"].dt.time  # For y-axis
-
-
-    fig_timeline = px.scatter(
-        timeline_df,
-        x="date",
-        y="time_of_day",
-        color="song" if selected_artist != "All" else "artist",
-        title=f"Play Timeline for {selected_artist if selected_artist != 'All' else selected_song}",
-        hover_data=["artist", "song", "timestamp"],
+    fig_timeline = build_timeline_fig(
+        data, start_date, end_date, selected_artist, selected_song
     )
-    fig_timeline.update_layout(yaxis_title="Time of Day")
     st.plotly_chart(fig_timeline, use_container_width=True)
 else:
     st.write("Select an artist or song to see the play timeline.")
@@ -156,14 +272,22 @@ else:
 # --- Recently Played Table ---
 
 st.subheader("Recently Played Songs")
-recent_plays = filtered_df.sort_values("timestamp", ascending=False).head(10)
-recent_plays = recent_plays[["timestamp", "artist", "song", "artwork_large"]]
+# filtered_df preserves load_data's timestamp order, so the 10 most recent
+# plays are just the last 10 rows reversed — no sort (or heap) needed at all.
+recent_plays = filtered_df.tail(10).iloc[::-1][["timestamp", "artist", "song", "artwork_large"]].copy()
 recent_plays["timestamp"] = recent_plays["timestamp"].dt.strftime(
     "%Y-%m-%d %H:%M:%S"
 )  # Format nicely
 
-# Display as a table with images
-st.write(recent_plays.to_html(escape=False, index=False, formatters={'artwork_large': lambda x: f'<img src="{x}" width="60">'}), unsafe_allow_html=True)
+# Display as a table with images. Building the rows directly is much cheaper
+# than DataFrame.to_html with a per-cell formatters lambda.
+header = '<tr><th>timestamp</th><th>artist</th><th>song</th><th>artwork</th></tr>'
+rows = ''.join(
+    f'<tr><td>{r.timestamp}</td><td>{r.artist}</td><td>{r.song}</td>'
+    f'<td><img src="{r.artwork_large}" width="60"></td></tr>'
+    for r in recent_plays.itertuples(index=False)
+)
+st.markdown(f'<table>{header}{rows}</table>', unsafe_allow_html=True)
 
 
 # --- Raw Data Table (Paginated) ---
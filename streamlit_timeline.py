@@ -1,43 +1,48 @@
+import numpy as np
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.io as pio
 from datetime import datetime
 
-st.title("Wal-Mart Radio Plays")
+from data import WMRADIO_DATA_URL, load_data
 
-df = pd.read_csv('https://storage.googleapis.com/wmradiopubbucket/data/wmradiodata.csv')
+# orjson's native encoder cuts figure-to-JSON time ~5-10x on large traces.
+pio.json.config.default_engine = "orjson"
 
-df['timestamp'] = pd.to_datetime(df['timestamp'])
+st.title("Wal-Mart Radio Plays")
 
-# Handle null values in artist column and convert to string
-df['artist'] = df['artist'].fillna('Unknown Artist').astype(str)
+df = load_data(WMRADIO_DATA_URL)
 
 # Create sidebar for filtering
 st.sidebar.header("Filter Options")
 
 filter_type = st.sidebar.radio("Filter by:", ["Artist", "Song"])
 
+# The categorical categories are already sorted and unique, and matching on
+# their integer codes avoids hashing every row's string in isin: get_indexer
+# resolves the selections once, np.isin then scans the int code array.
 if filter_type == "Artist":
+    artist_options = df['artist'].cat.categories.tolist()
     selected_artists = st.sidebar.multiselect(
         "Select Artists:",
-        options=sorted(df['artist'].unique()),
-        default=[df['artist'].iloc[0]]
+        options=artist_options,
+        default=[artist_options[0]]
     )
-    filtered_df = df[df['artist'].isin(selected_artists)]
+    selected_codes = df['artist'].cat.categories.get_indexer(selected_artists)
+    filtered_df = df[np.isin(df['artist'].cat.codes.values, selected_codes)]
 else:
+    song_options = df['song'].cat.categories.tolist()
     selected_songs = st.sidebar.multiselect(
         "Select Songs:",
-        options=sorted(df['song'].unique()),
-        default=[df['song'].iloc[0]]
+        options=song_options,
+        default=[song_options[0]]
     )
-    filtered_df = df[df['song'].isin(selected_songs)]
+    selected_codes = df['song'].cat.categories.get_indexer(selected_songs)
+    filtered_df = df[np.isin(df['song'].cat.codes.values, selected_codes)]
 
 # Create timeline visualization
 if not filtered_df.empty:
-    # Extract date and hour components from timestamp
-    filtered_df['date'] = filtered_df['timestamp'].dt.date
-    filtered_df['hour'] = filtered_df['timestamp'].dt.hour
-
     fig = px.scatter(
         filtered_df,
         x='date',  # Use 'date' for the x-axis
@@ -45,7 +50,8 @@ if not filtered_df.empty:
         color='song',
         hover_data=['song', 'artist', 'timestamp'],
         title=f"Play History Timeline for Selected {filter_type}s",
-        height=400
+        height=400,
+        render_mode='webgl'  # SVG scatter degrades past ~10k points
     )
 
     fig.update_layout(
@@ -2,12 +2,20 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson's native encoder cuts figure-to-JSON time ~5-10x on large traces.
+pio.json.config.default_engine = "orjson"
 import requests
+from requests.adapters import HTTPAdapter
 from io import BytesIO
 from PIL import Image
+from functools import lru_cache
 import numpy as np
 from urllib.parse import urlparse
+import threading
 import time
 
 # Set page config
@@ -26,23 +34,68 @@ st.markdown("Interactive analytics for your radio station's play history")
 @st.cache_data
 def load_data(file):
     try:
-        df = pd.read_csv(file)
-        df['artist'] = df['artist'].fillna('Unknown Artist').astype(str)
-        # Convert timestamp to datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        # Accept an already-built DataFrame (demo data) as well as a CSV
+        # file/buffer, so callers don't have to round-trip through to_csv.
+        # usecols keeps the parse (and the frame) to the columns the app
+        # actually reads, whatever else the feed grows over time.
+        if isinstance(file, pd.DataFrame):
+            df = file.copy()
+        else:
+            # The pyarrow engine parses the CSV multithreaded, and the arrow
+            # dtype backend keeps the string columns Arrow-backed so the
+            # categorical cast below dictionary-encodes the existing buffers
+            # instead of detouring through Python strings.
+            df = pd.read_csv(
+                file,
+                usecols=['pick_id', 'timestamp', 'artist', 'song', 'artwork_large'],
+                engine='pyarrow',
+                dtype_backend='pyarrow',
+                parse_dates=['timestamp'],
+            )
+        # Categoricals make every downstream groupby/unique/== run on integer
+        # codes instead of hashing Python strings, and cut memory to boot.
+        df['artist'] = df['artist'].fillna('Unknown Artist').astype('category')
+        df['song'] = df['song'].fillna('Unknown Song').astype('category')
+        # One cast back to numpy datetime64: the date filter and the bucket
+        # columns work on int64 views of the block, which Arrow timestamps
+        # don't expose.
+        df['timestamp'] = df['timestamp'].astype('datetime64[ns]')
         # Extract date components for filtering
-        df['date'] = df['timestamp'].dt.date
         df['hour'] = df['timestamp'].dt.hour
-        df['day_of_week'] = df['timestamp'].dt.day_name()
-        df['month'] = df['timestamp'].dt.month_name()
-        df['year'] = df['timestamp'].dt.year
+        # Ordered categorical up front so the day-of-week chart needs no
+        # re-categorization or manual reordering later.
+        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        df['day_of_week'] = pd.Categorical(df['timestamp'].dt.day_name(), categories=day_order, ordered=True)
+        # Calendar buckets as plain datetime64 unit casts (zero-cost integer
+        # ops). Grouping on these hits pandas' int64 groupby kernel instead of
+        # rebuilding pd.Grouper time bins on every rerun.
+        df['day'] = df['timestamp'].values.astype('datetime64[D]')
+        df['week'] = df['timestamp'].values.astype('datetime64[W]')
+        df['month_start'] = df['timestamp'].values.astype('datetime64[M]')
+        # Sort once; every downstream filter preserves order, so "most recent"
+        # becomes a reversal and time groupbys see presorted keys.
+        df = df.sort_values('timestamp').reset_index(drop=True)
         return df
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
 
 
+# Shared session with pooled connections, so artwork fetches to the same host
+# reuse TCP/TLS handshakes instead of reconnecting per image.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# Negative cache: remember recently failed URLs so reruns skip them instead of
+# re-paying the connect/read timeout.
+_bad_urls = {}
+_BAD_URL_TTL = 300  # seconds
+
+
 # Function to validate image URL
+@lru_cache(maxsize=4096)
 def is_valid_url(url):
     try:
         result = urlparse(url)
@@ -57,14 +110,105 @@ def get_image(url):
     if not is_valid_url(url):
         return None
 
+    last_fail = _bad_urls.get(url)
+    if last_fail is not None and time.time() - last_fail < _BAD_URL_TTL:
+        return None
+
     try:
-        response = requests.get(url, timeout=5)
+        # (connect, read) timeouts: fail fast on dead hosts rather than
+        # blocking rendering for the full 5s.
+        response = _session.get(url, timeout=(1, 3))
         if response.status_code == 200:
-            img = Image.open(BytesIO(response.content))
-            return img
-        return None
+            return Image.open(BytesIO(response.content))
     except Exception:
-        return None
+        pass
+    _bad_urls[url] = time.time()
+    return None
+
+
+def warm_artwork_cache(urls):
+    # Prefetch artwork into get_image's cache off the script thread, so the
+    # first tab render mostly finds its images already downloaded.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(get_image, urls))
+
+
+# Cached aggregation helpers. Each takes the (already filtered) frame as an
+# underscore arg so Streamlit doesn't hash the whole DataFrame, plus a small
+# filter-signature tuple that keys the cache; any widget change that doesn't
+# alter the signature serves the aggregation straight from cache.
+@st.cache_data
+def top_songs_agg(_df, sig):
+    return (_df.groupby(['song', 'artist'], observed=True).size().reset_index(name='plays')
+            .sort_values('plays', ascending=False).head(10))
+
+
+@st.cache_data
+def top_artists_agg(_df, sig):
+    # value_counts counts and sorts descending in one C pass (bincount over
+    # the category codes), so no groupby object or extra sort is built.
+    return (_df['artist'].value_counts().head(10)
+            .rename_axis('artist').reset_index(name='plays'))
+
+
+@st.cache_data
+def time_series_agg(_df, sig, key):
+    # key is one of the precomputed day/week/month_start bucket columns.
+    return (_df[key].value_counts().sort_index()
+            .rename_axis('date').reset_index(name='plays'))
+
+
+@st.cache_data
+def artist_trend_agg(_df, sig, artists, key):
+    artist_df = _df[_df['artist'].isin(artists)]
+    return (artist_df.groupby(['artist', key], observed=True)
+            .size().reset_index(name='plays')
+            .rename(columns={key: 'timestamp'}))
+
+
+@st.cache_data
+def option_list_agg(_df, sig, column):
+    # Unique over the int codes, then decode through the (already sorted)
+    # categories — no per-rerun Python string sort of the full unique set.
+    codes = np.unique(_df[column].cat.codes.to_numpy())
+    return _df[column].cat.categories[codes[codes >= 0]].tolist()
+
+
+@st.cache_data
+def artwork_map_agg(_df, sig):
+    # One pass over the frame; per-song artwork lookups then become indexed
+    # .loc hits instead of full-table scans.
+    return _df.groupby(['song', 'artist'], observed=True)['artwork_large'].first()
+
+
+@st.cache_data
+def hour_dist_agg(_df, sig):
+    return (_df['hour'].value_counts().sort_index()
+            .rename_axis('hour').reset_index(name='count'))
+
+
+@st.cache_data
+def to_csv_bytes(_df, sig):
+    # CSV bytes for the download button, built once per filter state.
+    return _df.to_csv(index=False).encode('utf-8')
+
+
+@st.cache_data
+def day_dist_agg(_df, sig):
+    # sort=False keeps the ordered categorical's Monday-first order and still
+    # reports zero-count days.
+    return (_df['day_of_week'].value_counts(sort=False)
+            .rename_axis('day_of_week').reset_index(name='count'))
+
+
+@st.cache_resource(show_spinner=False)
+def cached_fig(sig, _build):
+    # Live-figure store. cache_resource hands back the constructed figure
+    # object with no pickle round-trip, so a revisited filter state skips the
+    # whole px build (and Streamlit's reserialization of a fresh figure).
+    # _build is excluded from hashing, so sig must name the panel as well as
+    # the filter state that shaped its data.
+    return _build()
 
 
 # File upload option
@@ -85,45 +229,30 @@ if use_demo_data:
     # Expand the sample with more data to make the demo more interesting
     # Generate plays for the last 30 days
     import io
-    from random import choice, randint
 
     # Create a DataFrame from the sample data
     df_sample = pd.read_csv(io.StringIO(sample_data))
 
-    # Use the unique artists and songs from the sample
-    unique_artists = df_sample['artist'].unique()
-    songs_by_artist = {artist: df_sample[df_sample['artist'] == artist]['song'].unique() for artist in unique_artists}
-    artwork_by_artist = {artist: df_sample[df_sample['artist'] == artist]['artwork_large'].iloc[0] for artist in
-                         unique_artists}
-
-    # Generate 500 random plays over the last 30 days
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=30)
-
-    synthetic_data = []
-    for i in range(500):
-        random_timestamp = start_date + timedelta(
-            days=randint(0, 30),
-            hours=randint(0, 23),
-            minutes=randint(0, 59),
-            seconds=randint(0, 59)
-        )
-
-        random_artist = choice(list(unique_artists))
-        random_song = choice(list(songs_by_artist[random_artist]))
-        artwork = artwork_by_artist[random_artist]
-
-        synthetic_data.append({
-            'pick_id': 20303000000 + i,
-            'timestamp': random_timestamp.isoformat(),
-            'artist': random_artist,
-            'song': random_song,
-            'artwork_large': artwork
-        })
-
-    # Create DataFrame from synthetic data
-    demo_df = pd.DataFrame(synthetic_data)
-    df = load_data(io.StringIO(demo_df.to_csv(index=False)))
+    # Use the unique (artist, song) pairs and artwork from the sample
+    pairs = df_sample[['artist', 'song']].drop_duplicates().reset_index(drop=True)
+    artwork_by_artist = df_sample.drop_duplicates('artist').set_index('artist')['artwork_large']
+
+    # Generate 500 random plays over the last 30 days, vectorized: one RNG
+    # draw per field instead of a 500-iteration Python loop of timedelta and
+    # choice calls, and no CSV round-trip back through load_data.
+    n_plays = 500
+    start_date = datetime.now() - timedelta(days=30)
+
+    rng = np.random.default_rng()
+    pair_idx = rng.integers(0, len(pairs), size=n_plays)
+    demo_df = pd.DataFrame({
+        'pick_id': 20303000000 + np.arange(n_plays),
+        'timestamp': np.datetime64(start_date) + rng.integers(0, 31 * 86400, size=n_plays).astype('timedelta64[s]'),
+        'artist': pairs['artist'].to_numpy()[pair_idx],
+        'song': pairs['song'].to_numpy()[pair_idx],
+    })
+    demo_df['artwork_large'] = demo_df['artist'].map(artwork_by_artist)
+    df = load_data(demo_df)
     st.info("Using synthetic demo data. Upload your own CSV file for real analysis.")
 
 elif uploaded_file is not None:
@@ -136,18 +265,33 @@ if df is not None and not df.empty:
     # Success message
     st.success(f"Successfully loaded data with {len(df)} song plays")
 
-    # Fill empty artist names with string "Unknown Artist"
-    df['artist'] = df['artist'].fillna('Unknown Artist').astype(str)
-    df['song'] = df['song'].fillna('Unknown Song').astype(str)
-
-    df = df[~df['artist'].str.contains('The WMW Radio Network')]
-    df = df[~df['song'].str.contains('Promo')]
+    # Missing artist/song names already normalized (and made categorical) in load_data.
+    # Drop network/promo entries with one fused mask: test the small category
+    # sets once (regex off), map to codes, and slice a single time instead of
+    # two full str.contains scans and two intermediate frames.
+    bad_artists = np.where(df['artist'].cat.categories.str.contains('The WMW Radio Network', regex=False))[0]
+    bad_songs = np.where(df['song'].cat.categories.str.contains('Promo', regex=False))[0]
+    df = df[~(df['artist'].cat.codes.isin(bad_artists) | df['song'].cat.codes.isin(bad_songs))]
 
     # Display date range in the data
     min_date = df['timestamp'].min().date()
     max_date = df['timestamp'].max().date()
     st.info(f"Data spans from {min_date} to {max_date}")
 
+    # Small hashable signature of the loaded data; combined with the widget
+    # values below it keys the cached aggregation helpers.
+    data_sig = (len(df), str(df['timestamp'].min()), str(df['timestamp'].max()))
+
+    # Start warming the artwork cache as soon as the data is in: a daemon
+    # thread fetches the most-played covers while the user is still looking at
+    # the filters. session_state guards against respawning it on every rerun.
+    if 'artwork_prefetched' not in st.session_state:
+        warm_urls = df['artwork_large'].value_counts().head(30).index.tolist()
+        threading.Thread(
+            target=warm_artwork_cache, args=(warm_urls,), daemon=True
+        ).start()
+        st.session_state['artwork_prefetched'] = True
+
     # Sidebar for global filters
     st.sidebar.title("Filters")
 
@@ -159,22 +303,33 @@ if df is not None and not df.empty:
         max_value=max_date
     )
 
-    # Apply date filter
+    # Apply date filter. The frame is timestamp-sorted from load_data, so two
+    # binary searches find the range bounds and the filter is a contiguous
+    # slice — no boolean mask over every row.
     if len(date_range) == 2:
         start_date, end_date = date_range
-        filtered_df = df[(df['date'] >= start_date) & (df['date'] <= end_date)]
+        # Viewing the datetime64 block as raw int64 nanoseconds keeps the
+        # binary search on plain integers (.value gives the bounds in ns).
+        ts_ns = df['timestamp'].values.view('int64')
+        lo, hi = np.searchsorted(ts_ns, [
+            pd.Timestamp(start_date).value,
+            (pd.Timestamp(end_date) + pd.Timedelta('1D')).value,
+        ])
+        filtered_df = df.iloc[lo:hi]
     else:
         filtered_df = df
 
+    date_sig = (data_sig, tuple(str(d) for d in date_range))
+
     # Artist filter (optional)
-    all_artists = ['All Artists'] + sorted(filtered_df['artist'].unique().tolist())
+    all_artists = ['All Artists'] + option_list_agg(filtered_df, date_sig, 'artist')
     selected_artist = st.sidebar.selectbox("Filter by Artist", all_artists)
 
     if selected_artist != 'All Artists':
         filtered_df = filtered_df[filtered_df['artist'] == selected_artist]
 
     # Song filter (optional)
-    all_songs = ['All Songs'] + sorted(filtered_df['song'].unique().tolist())
+    all_songs = ['All Songs'] + option_list_agg(filtered_df, date_sig + (selected_artist,), 'song')
     selected_song = st.sidebar.selectbox("Filter by Song", all_songs)
 
     if selected_song != 'All Songs':
@@ -183,15 +338,18 @@ if df is not None and not df.empty:
     # Display filtered data size
     st.sidebar.info(f"Showing {len(filtered_df)} plays")
 
-    # Download filtered data as CSV
-    if st.sidebar.button("Download Filtered Data"):
-        csv = filtered_df.to_csv(index=False).encode('utf-8')
-        st.sidebar.download_button(
-            label="Download CSV",
-            data=csv,
-            file_name="filtered_radio_data.csv",
-            mime="text/csv"
-        )
+    # Full filter-state signature for the cached aggregation helpers.
+    filter_sig = date_sig + (selected_artist, selected_song)
+
+    # Download filtered data as CSV. A single download_button (the old
+    # button-then-button flow needed two clicks and rebuilt the CSV on the
+    # rerun in between); the bytes come from the per-filter-state cache.
+    st.sidebar.download_button(
+        label="Download Filtered Data",
+        data=to_csv_bytes(filtered_df, filter_sig),
+        file_name="filtered_radio_data.csv",
+        mime="text/csv"
+    )
 
     # Main dashboard - using tabs for organization
     tab1, tab2, tab3, tab4 = st.tabs(["Top Charts", "Trends Over Time", "Timeline", "Recent Plays"])
@@ -203,43 +361,52 @@ if df is not None and not df.empty:
 
         with col1:
             # Top songs visualization
-            top_songs = filtered_df.groupby(['song', 'artist']).size().reset_index(name='plays')
-            top_songs = top_songs.sort_values('plays', ascending=False).head(10)
+            top_songs = top_songs_agg(filtered_df, filter_sig)
 
-            # Create a combined column for artist - song
-            top_songs['title'] = top_songs['artist'] + ' - ' + top_songs['song']
+            # Create a combined column for artist - song. str.cat joins both
+            # columns in a single vectorized pass instead of two elementwise
+            # string additions with an intermediate Series.
+            top_songs['title'] = top_songs['artist'].astype(str).str.cat(
+                top_songs['song'].astype(str), sep=' - ')
 
             # Create horizontal bar chart
-            fig_songs = px.bar(
-                top_songs,
-                x='plays',
-                y='title',
-                orientation='h',
-                title='Top 10 Most Played Songs',
-                color='plays',
-                color_continuous_scale=px.colors.sequential.Viridis,
-                labels={'plays': 'Number of Plays', 'title': 'Song'}
-            )
-            fig_songs.update_layout(yaxis={'categoryorder': 'total ascending'})
-            st.plotly_chart(fig_songs, use_container_width=True)
+            def build_songs_fig():
+                fig = px.bar(
+                    top_songs,
+                    x='plays',
+                    y='title',
+                    orientation='h',
+                    title='Top 10 Most Played Songs',
+                    color='plays',
+                    color_continuous_scale=px.colors.sequential.Viridis,
+                    labels={'plays': 'Number of Plays', 'title': 'Song'}
+                )
+                fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+                return fig
+
+            fig_songs = cached_fig(('top_songs', filter_sig), build_songs_fig)
+            st.plotly_chart(fig_songs, use_container_width=True, key='top_songs_chart')
 
         with col2:
             # Top artists visualization
-            top_artists = filtered_df.groupby('artist').size().reset_index(name='plays')
-            top_artists = top_artists.sort_values('plays', ascending=False).head(10)
-
-            fig_artists = px.bar(
-                top_artists,
-                x='plays',
-                y='artist',
-                orientation='h',
-                title='Top 10 Most Played Artists',
-                color='plays',
-                color_continuous_scale=px.colors.sequential.Viridis,
-                labels={'plays': 'Number of Plays', 'artist': 'Artist'}
-            )
-            fig_artists.update_layout(yaxis={'categoryorder': 'total ascending'})
-            st.plotly_chart(fig_artists, use_container_width=True)
+            top_artists = top_artists_agg(filtered_df, filter_sig)
+
+            def build_artists_fig():
+                fig = px.bar(
+                    top_artists,
+                    x='plays',
+                    y='artist',
+                    orientation='h',
+                    title='Top 10 Most Played Artists',
+                    color='plays',
+                    color_continuous_scale=px.colors.sequential.Viridis,
+                    labels={'plays': 'Number of Plays', 'artist': 'Artist'}
+                )
+                fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+                return fig
+
+            fig_artists = cached_fig(('top_artists', filter_sig), build_artists_fig)
+            st.plotly_chart(fig_artists, use_container_width=True, key='top_artists_chart')
 
         # Display top songs with artwork
         st.subheader("Top Songs with Artwork")
@@ -248,21 +415,32 @@ if df is not None and not df.empty:
         top_n = min(5, len(top_songs))  # Ensure we don't exceed the available songs
         if top_n > 0:
             cols = st.columns(top_n)
-
-            for i, (_, row) in enumerate(top_songs.head(top_n).iterrows()):
+            top_rows = top_songs.head(top_n)
+
+            # Look up the artwork URLs, then fetch them concurrently: the wait
+            # becomes the slowest single download instead of the sum, and
+            # repeat URLs come straight from get_image's cache.
+            artwork_map = artwork_map_agg(filtered_df, filter_sig)
+            artwork_urls = [
+                artwork_map.loc[(song, artist)]
+                for song, artist in zip(top_rows['song'], top_rows['artist'])
+            ]
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                imgs = list(ex.map(get_image, artwork_urls))
+
+            # Project to the columns the loop reads and iterate plain tuples:
+            # name=None skips building a namedtuple per row.
+            top_tuples = top_rows[['artist', 'song', 'plays']].itertuples(
+                index=False, name=None)
+            for i, ((artist, song, plays), img) in enumerate(zip(top_tuples, imgs)):
                 with cols[i]:
-                    # Get artwork image
-                    artwork_url = filtered_df[(filtered_df['song'] == row['song']) &
-                                              (filtered_df['artist'] == row['artist'])]['artwork_large'].iloc[0]
-                    img = get_image(artwork_url)
-
                     if img is not None:
-                        st.image(img, caption=f"{row['artist']} - {row['song']}")
+                        st.image(img, caption=f"{artist} - {song}")
                     else:
                         st.image("https://placehold.co/150x150?text=No+Image",
-                                 caption=f"{row['artist']} - {row['song']}")
+                                 caption=f"{artist} - {song}")
 
-                    st.write(f"Plays: {row['plays']}")
+                    st.write(f"Plays: {plays}")
         else:
             st.info("No songs to display")
 
@@ -276,33 +454,31 @@ if df is not None and not df.empty:
             horizontal=True
         )
 
-        # Prepare data based on selected time granularity
-        if time_granularity == "Daily":
-            time_df = filtered_df.groupby(pd.Grouper(key='timestamp', freq='D')).size().reset_index(name='plays')
-            time_df.columns = ['date', 'plays']
-            x_axis = 'date'
-            title = 'Daily Play Count'
-        elif time_granularity == "Weekly":
-            time_df = filtered_df.groupby(pd.Grouper(key='timestamp', freq='W')).size().reset_index(name='plays')
-            time_df.columns = ['date', 'plays']
-            title = 'Weekly Play Count'
-            x_axis = 'date'
-        else:  # Monthly
-            time_df = filtered_df.groupby(pd.Grouper(key='timestamp', freq='M')).size().reset_index(name='plays')
-            time_df.columns = ['date', 'plays']
-            title = 'Monthly Play Count'
-            x_axis = 'date'
+        # Map the selected granularity straight to its bucket column and chart
+        # title — one lookup instead of parallel if/elif chains that have to
+        # stay in sync here and again for the artist trends below.
+        bucket_col, title = {
+            'Daily': ('day', 'Daily Play Count'),
+            'Weekly': ('week', 'Weekly Play Count'),
+            'Monthly': ('month_start', 'Monthly Play Count'),
+        }[time_granularity]
+        time_df = time_series_agg(filtered_df, filter_sig, bucket_col)
 
         # Create time series chart
-        fig_time = px.line(
-            time_df,
-            x=x_axis,
-            y='plays',
-            title=title,
-            labels={'plays': 'Number of Plays', 'date': 'Date'},
-            markers=True
-        )
-        st.plotly_chart(fig_time, use_container_width=True)
+        def build_time_fig():
+            return px.line(
+                time_df,
+                x='date',
+                y='plays',
+                title=title,
+                labels={'plays': 'Number of Plays', 'date': 'Date'},
+                markers=True,
+                render_mode='webgl'  # Scattergl: daily series over a long
+                                     # range outgrow SVG rendering quickly
+            )
+
+        fig_time = cached_fig(('time_series', filter_sig, bucket_col), build_time_fig)
+        st.plotly_chart(fig_time, use_container_width=True, key='time_series_chart')
 
         # Artist or song trends over time
         st.subheader("Trends for Top Artists")
@@ -319,62 +495,57 @@ if df is not None and not df.empty:
         )
 
         if selected_trend_artists:
-            # Filter data for selected artists
-            artist_df = filtered_df[filtered_df['artist'].isin(selected_trend_artists)]
-
-            # Group by artist and time period
-            if time_granularity == "Daily":
-                artist_time_df = artist_df.groupby(['artist', pd.Grouper(key='timestamp', freq='D')]). \
-                    size().reset_index(name='plays')
-            elif time_granularity == "Weekly":
-                artist_time_df = artist_df.groupby(['artist', pd.Grouper(key='timestamp', freq='W')]). \
-                    size().reset_index(name='plays')
-            else:  # Monthly
-                artist_time_df = artist_df.groupby(['artist', pd.Grouper(key='timestamp', freq='M')]). \
-                    size().reset_index(name='plays')
+            # Group by artist and time period (the helper filters to the
+            # selected artists internally); bucket_col comes from the
+            # granularity dispatch above.
+            artist_time_df = artist_trend_agg(
+                filtered_df, filter_sig, tuple(selected_trend_artists), bucket_col)
 
             # Create line chart for artist trends
-            fig_artist_trends = px.line(
-                artist_time_df,
-                x='timestamp',
-                y='plays',
-                color='artist',
-                title=f'Trend for Selected Artists ({time_granularity})',
-                labels={'plays': 'Number of Plays', 'timestamp': 'Date', 'artist': 'Artist'},
-                markers=True
-            )
-            st.plotly_chart(fig_artist_trends, use_container_width=True)
+            def build_artist_trends_fig():
+                return px.line(
+                    artist_time_df,
+                    x='timestamp',
+                    y='plays',
+                    color='artist',
+                    title=f'Trend for Selected Artists ({time_granularity})',
+                    labels={'plays': 'Number of Plays', 'timestamp': 'Date', 'artist': 'Artist'},
+                    markers=True,
+                    render_mode='webgl'  # one trace per artist multiplies the point count
+                )
+
+            fig_artist_trends = cached_fig(
+                ('artist_trends', filter_sig, tuple(selected_trend_artists), bucket_col),
+                build_artist_trends_fig)
+            st.plotly_chart(fig_artist_trends, use_container_width=True,
+                            key='artist_trends_chart')
 
         # Hour of day distribution
         st.subheader("Play Distribution by Hour of Day")
-        hour_dist = filtered_df.groupby('hour').size().reset_index(name='count')
+        hour_dist = hour_dist_agg(filtered_df, filter_sig)
 
-        fig_hour = px.bar(
+        fig_hour = cached_fig(('hour_dist', filter_sig), lambda: px.bar(
             hour_dist,
             x='hour',
             y='count',
             labels={'count': 'Number of Plays', 'hour': 'Hour of Day (24h)'},
             title='Distribution of Plays by Hour'
-        )
-        st.plotly_chart(fig_hour, use_container_width=True)
+        ))
+        st.plotly_chart(fig_hour, use_container_width=True, key='hour_dist_chart')
 
         # Day of week distribution
         st.subheader("Play Distribution by Day of Week")
 
-        # Order days correctly
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        day_dist = filtered_df.groupby('day_of_week').size().reset_index(name='count')
-        day_dist['day_of_week'] = pd.Categorical(day_dist['day_of_week'], categories=day_order, ordered=True)
-        day_dist = day_dist.sort_values('day_of_week')
+        day_dist = day_dist_agg(filtered_df, filter_sig)
 
-        fig_day = px.bar(
+        fig_day = cached_fig(('day_dist', filter_sig), lambda: px.bar(
             day_dist,
             x='day_of_week',
             y='count',
             labels={'count': 'Number of Plays', 'day_of_week': 'Day of Week'},
             title='Distribution of Plays by Day of Week'
-        )
-        st.plotly_chart(fig_day, use_container_width=True)
+        ))
+        st.plotly_chart(fig_day, use_container_width=True, key='day_dist_chart')
 
     with tab3:
         st.header("Timeline Visualization")
@@ -384,7 +555,7 @@ if df is not None and not df.empty:
 
         if filter_type == "Artist":
             # Get all artists
-            all_timeline_artists = sorted(filtered_df['artist'].unique().tolist())
+            all_timeline_artists = option_list_agg(filtered_df, filter_sig, 'artist')
             if all_timeline_artists:
                 selected_timeline_item = st.selectbox("Select Artist", all_timeline_artists)
                 timeline_df = filtered_df[filtered_df['artist'] == selected_timeline_item]
@@ -395,7 +566,7 @@ if df is not None and not df.empty:
                 title = "No data available"
         else:  # Song
             # Get all songs
-            all_songs = sorted(filtered_df['song'].unique().tolist())
+            all_songs = option_list_agg(filtered_df, filter_sig, 'song')
             if all_songs:
                 selected_timeline_item = st.selectbox("Select Song", all_songs)
                 timeline_df = filtered_df[filtered_df['song'] == selected_timeline_item]
@@ -420,66 +591,94 @@ if df is not None and not df.empty:
 
         # Create a timeline visualization
         if not timeline_df.empty:
-            # Create a scatter plot where each point represents a play
-            fig_timeline = px.scatter(
-                timeline_df,
-                x='timestamp',
-                y=[1] * len(timeline_df),  # All points on the same line
-                title=title,
-                labels={'timestamp': 'Date and Time', 'y': ''},
-                height=300
-            )
-
-            # Update layout to make it look more like a timeline
-            fig_timeline.update_traces(marker=dict(size=10, symbol='circle', color='royalblue'))
-            fig_timeline.update_yaxes(showticklabels=False, showgrid=False)
-            fig_timeline.update_layout(showlegend=False)
-
-            st.plotly_chart(fig_timeline, use_container_width=True)
+            timeline_sig = (filter_sig, filter_type, selected_timeline_item)
+
+            def build_timeline_fig():
+                # Bin plays to the hour and size the markers by count, so the
+                # browser renders O(bins) points instead of one per play and
+                # the serialized trace stays small for heavy rotation artists.
+                hourly_bins = (timeline_df.groupby(timeline_df['timestamp'].dt.floor('h'))
+                               .size().reset_index(name='count'))
+                fig = px.scatter(
+                    hourly_bins,
+                    x='timestamp',
+                    y=[1] * len(hourly_bins),  # All points on the same line
+                    size='count',
+                    title=title,
+                    labels={'timestamp': 'Date and Time', 'y': ''},
+                    height=300,
+                    render_mode='webgl'  # WebGL instead of SVG past ~10k points
+                )
+
+                # Update layout to make it look more like a timeline
+                fig.update_traces(marker=dict(symbol='circle', color='royalblue'))
+                fig.update_yaxes(showticklabels=False, showgrid=False)
+                fig.update_layout(showlegend=False)
+                return fig
+
+            fig_timeline = cached_fig(('timeline',) + timeline_sig, build_timeline_fig)
+            st.plotly_chart(fig_timeline, use_container_width=True, key='timeline_chart')
 
             # Display histogram of plays by hour of day
             st.subheader("Plays by Hour of Day")
-            hour_counts = timeline_df.groupby(timeline_df['timestamp'].dt.hour).size().reset_index(name='count')
-            hour_counts.columns = ['hour', 'count']
-
-            fig_hours = px.bar(
-                hour_counts,
-                x='hour',
-                y='count',
-                title=f"Distribution of Plays by Hour of Day for {selected_timeline_item}",
-                labels={'count': 'Number of Plays', 'hour': 'Hour of Day (24h)'}
-            )
-            st.plotly_chart(fig_hours, use_container_width=True)
+
+            def build_timeline_hours_fig():
+                hour_counts = (timeline_df['hour'].value_counts().sort_index()
+                               .rename_axis('hour').reset_index(name='count'))
+                return px.bar(
+                    hour_counts,
+                    x='hour',
+                    y='count',
+                    title=f"Distribution of Plays by Hour of Day for {selected_timeline_item}",
+                    labels={'count': 'Number of Plays', 'hour': 'Hour of Day (24h)'}
+                )
+
+            fig_hours = cached_fig(('timeline_hours',) + timeline_sig,
+                                   build_timeline_hours_fig)
+            st.plotly_chart(fig_hours, use_container_width=True, key='timeline_hours_chart')
 
             # Display a sample of plays with artwork
             st.subheader("Sample Plays")
 
-            # Create columns for display
+            # Create columns for display. Positional choice + iloc skips the
+            # label reindex DataFrame.sample does, and the session-seeded rng
+            # keeps the sample stable across reruns so the grid doesn't
+            # flicker on every widget change.
             sample_size = min(5, len(timeline_df))
-            sample_df = timeline_df.sample(sample_size) if sample_size > 0 else timeline_df
-
-            for _, row in sample_df.iterrows():
+            if 'sample_seed' not in st.session_state:
+                st.session_state['sample_seed'] = np.random.SeedSequence().entropy
+            rng = np.random.default_rng(st.session_state['sample_seed'])
+            sample_idx = rng.choice(len(timeline_df), sample_size, replace=False)
+            sample_df = timeline_df.iloc[sample_idx]
+
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                imgs = list(ex.map(get_image, sample_df['artwork_large'].tolist()))
+
+            sample_tuples = sample_df[
+                ['artist', 'song', 'timestamp', 'pick_id']
+            ].itertuples(index=False, name=None)
+            for (artist, song, timestamp, pick_id), img in zip(sample_tuples, imgs):
                 col1, col2 = st.columns([1, 4])
 
                 with col1:
-                    img = get_image(row['artwork_large'])
                     if img is not None:
                         st.image(img, width=100)
                     else:
                         st.image("https://placehold.co/100x100?text=No+Image")
 
                 with col2:
-                    st.write(f"**{row['artist']} - {row['song']}**")
-                    st.write(f"Played: {row['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
-                    st.write(f"ID: {row['pick_id']}")
+                    st.write(f"**{artist} - {song}**")
+                    st.write(f"Played: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+                    st.write(f"ID: {pick_id}")
         else:
             st.info(f"No plays found for the selected {filter_type.lower()}")
 
     with tab4:
         st.header("Recent Plays")
 
-        # Sort by most recent first
-        recent_plays = filtered_df.sort_values('timestamp', ascending=False)
+        # Most recent first: the frame is already timestamp-sorted from
+        # load_data, so this is a free reversed view rather than a sort.
+        recent_plays = filtered_df.iloc[::-1]
 
         # Pagination
         plays_per_page = st.slider("Plays per page", 5, 50, 10)
@@ -501,23 +700,28 @@ if df is not None and not df.empty:
             # Display info about pagination
             st.info(f"Showing plays {start_idx + 1} to {end_idx} of {len(recent_plays)}")
 
-            # Display plays
-            for _, row in current_plays.iterrows():
+            # Display plays, fetching all artwork for the page concurrently
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                imgs = list(ex.map(get_image, current_plays['artwork_large'].tolist()))
+
+            page_tuples = current_plays[
+                ['artist', 'song', 'timestamp', 'pick_id']
+            ].itertuples(index=False, name=None)
+            for (artist, song, timestamp, pick_id), img in zip(page_tuples, imgs):
                 col1, col2, col3 = st.columns([1, 3, 1])
 
                 with col1:
-                    img = get_image(row['artwork_large'])
                     if img is not None:
                         st.image(img, width=120)
                     else:
                         st.image("https://placehold.co/120x120?text=No+Image")
 
                 with col2:
-                    st.subheader(f"{row['artist']} - {row['song']}")
-                    st.write(f"Played at: {row['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
+                    st.subheader(f"{artist} - {song}")
+                    st.write(f"Played at: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
 
                 with col3:
-                    st.write(f"**ID**: {row['pick_id']}")
+                    st.write(f"**ID**: {pick_id}")
 
                 # Add a divider between entries
                 st.divider()